@@ -1,27 +1,44 @@
 """
 Central configuration: database engine factory and path constants.
+
+.env loading is deferred until a connection is actually needed, so importing
+this module (e.g. for SCHEMA_DIR) stays cheap and works without DATABASE_URL.
 """
+import functools
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
-# Load .env from the project root (two levels up from this file)
 _PROJECT_ROOT = Path(__file__).parents[1]
-load_dotenv(_PROJECT_ROOT / ".env")
+
+
+@functools.cache
+def _load() -> None:
+    """Load .env from the project root (two levels up from this file), once."""
+    from dotenv import load_dotenv
+
+    load_dotenv(_PROJECT_ROOT / ".env")
+
 
 # ---------------------------------------------------------------------------
 # Connection
 # ---------------------------------------------------------------------------
-DATABASE_URL: str = os.environ["DATABASE_URL"]
+
+def __getattr__(name: str) -> str:
+    # DATABASE_URL is resolved lazily so .env is only read on first access
+    if name == "DATABASE_URL":
+        _load()
+        return os.environ["DATABASE_URL"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_engine(echo: bool = False) -> Engine:
     """Return a connection-pooled SQLAlchemy engine."""
+    _load()
     return create_engine(
-        DATABASE_URL,
+        os.environ["DATABASE_URL"],
         pool_size=5,
         max_overflow=10,
         pool_pre_ping=True,
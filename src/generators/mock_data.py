@@ -3,26 +3,50 @@ Mock data generator for the warehouse pipeline.
 
 Produces three datasets with calibrated dirty-data ratios:
   - web_events.json         40k rows  (~5% null user_id, ~3% dup session_id,
-                                        50/50 ISO vs epoch timestamps)
+                                        50/50 ISO vs epoch timestamps; written as
+                                        web_events.parquet if WEB_EVENTS_FORMAT=parquet)
   - crm_users.csv           30k rows  (~2% dup emails, ~30% full state names,
                                         4 phone formats)
   - sales_transactions.parquet  30k rows  (~1% negative totals, ~2% future dates,
                                             ~2% dup transaction_ids)
 
-All generators are seeded (Faker seed=42, random.seed=42) for reproducibility.
+All generators take an explicit NumPy Generator (see make_rng, default seed=42)
+and derive their Faker seed from it, so output is reproducible.
 """
 from __future__ import annotations
 
-import json
-import random
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
+import orjson
 import pandas as pd
-from faker import Faker
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+@lru_cache(maxsize=None)
+def _get_fake() -> Faker:
+    """Return the shared Faker instance, importing faker on first use."""
+    from faker import Faker
+
+    fake = Faker()
+    fake.seed_instance(42)   # instance-local stream; never touches the Faker.seed global
+    return fake
+
+
+def make_rng(seed: int | np.random.SeedSequence = 42) -> np.random.Generator:
+    """Return a PCG64 Generator seeded from *seed* (int or spawned SeedSequence)."""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return np.random.default_rng(seed)
 
-fake = Faker()
-Faker.seed(42)
-random.seed(42)
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -57,6 +81,10 @@ STATE_FULL_NAMES = {
     "WI": "Wisconsin", "WY": "Wyoming",
 }
 
+# Parallel abbr / full-name arrays, indexed by the same state index
+STATE_ABBR_ARR = np.array(US_STATES_ABBR, dtype=object)
+STATE_FULL_ARR = np.array([STATE_FULL_NAMES[a] for a in US_STATES_ABBR], dtype=object)
+
 PRODUCTS = [
     ("P001", "Laptop Pro 15", "Electronics", 1299.99),
     ("P002", "Wireless Mouse", "Electronics", 29.99),
@@ -80,155 +108,326 @@ PRODUCTS = [
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _phone_variants(fake_instance: Faker) -> str:
-    """Return a phone number in one of 4 dirty formats."""
-    digits = "".join(filter(str.isdigit, fake_instance.phone_number()))[-10:]
-    fmt = random.randint(0, 3)
-    if fmt == 0:
-        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-    elif fmt == 1:
-        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
-    elif fmt == 2:
-        return f"+1{digits}"
-    else:
-        return digits
-
-
-def _iso_or_epoch(dt_obj) -> str | int:
-    """Return timestamp as ISO string or Unix epoch integer (50/50 split)."""
-    if random.random() < 0.5:
-        return dt_obj.isoformat()
-    return int(dt_obj.timestamp())
+# Phone layouts — each "d" is filled with one digit; shorter layouts are NUL-padded
+_PHONE_LAYOUTS = [
+    "(ddd) ddd-dddd",   # (555) 123-4567
+    "ddd-ddd-dddd",     # 555-123-4567
+    "+1dddddddddd",     # +15551234567
+    "dddddddddd",       # 5551234567
+]
+_PHONE_WIDTH = max(len(layout) for layout in _PHONE_LAYOUTS)
+_PHONE_TEMPLATES = np.array(
+    [list(layout.ljust(_PHONE_WIDTH, "\0").encode("ascii")) for layout in _PHONE_LAYOUTS],
+    dtype=np.uint8,
+)
+_PHONE_DIGIT_POS = np.array(
+    [[i for i, ch in enumerate(layout) if ch == "d"] for layout in _PHONE_LAYOUTS]
+)
+
+
+def _phone_variants(digits: np.ndarray, fmts: np.ndarray) -> np.ndarray:
+    """
+    Format an (n, 10) array of ASCII digit bytes into one of 4 dirty phone
+    formats per row (*fmts* in 0..3), assembled in a single uint8 buffer.
+    """
+    buf = _PHONE_TEMPLATES[fmts]
+    buf[np.arange(len(fmts))[:, None], _PHONE_DIGIT_POS[fmts]] = digits
+    return buf.view(f"S{_PHONE_WIDTH}").ravel().astype(str).astype(object)
+
+
+# UUID layout: 32 hex digits in 8-4-4-4-12 groups; two ASCII hex chars per byte
+_UUID_TEMPLATE = np.frombuffer(b"xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx", dtype=np.uint8)
+_UUID_HEX_POS = np.flatnonzero(_UUID_TEMPLATE != ord("-"))
+_HEX_LUT = np.array(
+    [list(f"{i:02x}".encode("ascii")) for i in range(256)], dtype=np.uint8
+)
+
+
+def _seeded_fake(rng: np.random.Generator) -> Faker:
+    """Return the shared Faker instance, re-seeded with a seed drawn from *rng*."""
+    fake = _get_fake()
+    fake.seed_instance(int(rng.integers(2**32)))
+    return fake
+
+
+@lru_cache(maxsize=None)
+def _name_pools() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pre-generated (first names, last names, cities) Faker pools — sampling an
+    index is far cheaper than a Faker call.  Built once, always from seed 42.
+    """
+    fake = _get_fake()
+    fake.seed_instance(42)
+    return (
+        np.array([fake.first_name() for _ in range(2_000)], dtype=object),
+        np.array([fake.last_name() for _ in range(2_000)], dtype=object),
+        np.array([fake.city() for _ in range(5_000)], dtype=object),
+    )
+
+
+def _uuid4_array(n: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Return *n* canonical UUID4 strings built from one batch of seeded random
+    bytes, with version/variant bits set and hex-encoded via a lookup table.
+    """
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40   # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80   # RFC 4122 variant
+    buf = np.tile(_UUID_TEMPLATE, (n, 1))
+    buf[:, _UUID_HEX_POS] = _HEX_LUT[raw].reshape(n, 32)
+    return buf.view(f"S{len(_UUID_TEMPLATE)}").ravel().astype(str).astype(object)
+
+
+def _random_dates(
+    start: pd.Timestamp, end: pd.Timestamp, n: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Return *n* ISO date strings drawn uniformly from [start, end] (inclusive)."""
+    lo, hi = (np.datetime64(ts.date(), "D").astype(np.int64) for ts in (start, end))
+    days = rng.integers(lo, hi + 1, n).astype("datetime64[D]")
+    return np.datetime_as_string(days, unit="D")
 
 
 # ---------------------------------------------------------------------------
 # Dataset generators
 # ---------------------------------------------------------------------------
 
-def generate_web_events(n: int = 40_000) -> list[dict]:
+def _web_event_columns(n: int, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Build the web-events dataset as a dict of object arrays, one per column."""
+    fake = _seeded_fake(rng)
+    user_pool = _uuid4_array(5_000, rng)
+    session_pool = _uuid4_array(int(n * 0.97), rng)  # 3% will be reused
+    # Faker URIs / country codes are slow per call — sample from small pools
+    url_pool = np.array([fake.uri() for _ in range(2_000)], dtype=object)
+    country_pool = np.array([fake.country_code() for _ in range(500)], dtype=object)
+
+    user_id = np.where(
+        rng.random(n) < 0.05, None, user_pool[rng.integers(0, len(user_pool), n)]
+    )
+    session_idx = np.where(
+        rng.random(n) < 0.03,
+        rng.integers(0, 100, n),                # reuse from small bucket → duplicates
+        rng.integers(0, len(session_pool), n),
+    )
+    referrer = np.where(
+        rng.random(n) > 0.3, url_pool[rng.integers(0, len(url_pool), n)], None
+    )
+
+    # Timestamps over the last 3 years, 50/50 ISO string vs Unix epoch
+    now = int(pd.Timestamp.now(tz="UTC").timestamp())
+    epoch = rng.integers(now - 3 * 365 * 86_400, now, n)
+    iso = pd.to_datetime(epoch, unit="s").strftime("%Y-%m-%dT%H:%M:%S")
+    timestamp = np.where(
+        rng.random(n) < 0.5, iso.to_numpy(dtype=object), epoch.astype(object)
+    )
+
+    return {
+        "user_id": user_id,
+        "session_id": session_pool[session_idx],
+        "event_type": rng.choice(EVENT_TYPES, n),
+        "page_url": url_pool[rng.integers(0, len(url_pool), n)],
+        "referrer": referrer,
+        "device_type": rng.choice(DEVICE_TYPES, n),
+        "timestamp": timestamp,
+        "country": country_pool[rng.integers(0, len(country_pool), n)],
+    }
+
+
+def generate_web_events(
+    n: int = 40_000, rng: np.random.Generator | None = None
+) -> list[dict]:
     """Generate web events with ~5% null user_id, ~3% dup session_id, mixed timestamps."""
-    user_pool = [fake.uuid4() for _ in range(5_000)]
-    session_pool = [fake.uuid4() for _ in range(int(n * 0.97))]  # 3% will be reused
-
-    rows = []
-    for _ in range(n):
-        user_id = None if random.random() < 0.05 else random.choice(user_pool)
-        session_id = (
-            random.choice(session_pool[:100])          # reuse from small bucket → duplicates
-            if random.random() < 0.03
-            else random.choice(session_pool)
-        )
-        ts = fake.date_time_between(start_date="-3y", end_date="now")
-        rows.append({
-            "user_id": user_id,
-            "session_id": session_id,
-            "event_type": random.choice(EVENT_TYPES),
-            "page_url": fake.uri(),
-            "referrer": fake.uri() if random.random() > 0.3 else None,
-            "device_type": random.choice(DEVICE_TYPES),
-            "timestamp": _iso_or_epoch(ts),
-            "country": fake.country_code(),
-        })
-    return rows
-
-
-def generate_crm_users(n: int = 30_000) -> pd.DataFrame:
+    columns = _web_event_columns(n, rng if rng is not None else make_rng())
+    # .tolist() yields native Python str/int/None so orjson needs no default hook
+    values = zip(*(col.tolist() for col in columns.values()))
+    return [dict(zip(columns, row)) for row in values]
+
+
+def generate_crm_users(
+    n: int = 30_000, rng: np.random.Generator | None = None
+) -> pd.DataFrame:
     """Generate CRM users with ~2% dup emails, ~30% full state names, 4 phone formats."""
-    email_pool = [fake.unique.email() for _ in range(int(n * 0.98))]
-    fake.unique.clear()
-
-    records = []
-    for i in range(n):
-        state_abbr = random.choice(US_STATES_ABBR)
-        # ~30% full state name instead of abbreviation
-        state_val = STATE_FULL_NAMES[state_abbr] if random.random() < 0.30 else state_abbr
-
-        # ~2% duplicate emails
-        if random.random() < 0.02 and email_pool:
-            email = random.choice(email_pool[:200])
-        else:
-            email = email_pool[i % len(email_pool)]
-
-        records.append({
-            "user_id": fake.uuid4(),
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
-            "email": email,
-            "phone": _phone_variants(fake),
-            "state": state_val,
-            "city": fake.city(),
-            "signup_date": fake.date_between(start_date="-5y", end_date="today").isoformat(),
-            "plan_tier": random.choice(PLAN_TIERS),
-        })
-    return pd.DataFrame(records)
-
-
-def generate_sales_transactions(n: int = 30_000) -> pd.DataFrame:
+    rng = rng if rng is not None else make_rng()
+    first_names, last_names, cities = _name_pools()
+    fake = _seeded_fake(rng)
+
+    # Unique emails as first.last<row>@domain — the row suffix guarantees
+    # uniqueness, so no per-row fake.unique.email() calls are needed
+    pool_size = int(n * 0.98)
+    domains = np.array(
+        [fake.free_email_domain() for _ in range(25)]
+        + [fake.domain_name() for _ in range(25)]
+    )
+    local_part = np.char.lower(
+        (
+            first_names[rng.integers(0, len(first_names), pool_size)]
+            + "."
+            + last_names[rng.integers(0, len(last_names), pool_size)]
+        ).astype(str)
+    )
+    email_pool = np.char.add(
+        np.char.add(local_part, np.arange(pool_size).astype(str)),
+        np.char.add("@", domains[rng.integers(0, len(domains), pool_size)]),
+    ).astype(object)
+
+    today = pd.Timestamp.today()
+    state_idx = rng.integers(0, len(US_STATES_ABBR), n)
+    # ~30% full state name instead of abbreviation
+    state_val = np.where(
+        rng.random(n) < 0.30, STATE_FULL_ARR[state_idx], STATE_ABBR_ARR[state_idx]
+    )
+
+    # 4 phone formats, rendered in one batch from random ASCII digits
+    phone = _phone_variants(
+        rng.integers(0, 10, (n, 10), dtype=np.uint8) + ord("0"),
+        rng.integers(0, len(_PHONE_LAYOUTS), n),
+    )
+
+    # ~2% duplicate emails
+    email = np.where(
+        rng.random(n) < 0.02,
+        email_pool[rng.integers(0, min(200, len(email_pool)), n)],
+        email_pool[np.arange(n) % len(email_pool)],
+    )
+
+    return pd.DataFrame({
+        "user_id": _uuid4_array(n, rng),
+        "first_name": first_names[rng.integers(0, len(first_names), n)],
+        "last_name": last_names[rng.integers(0, len(last_names), n)],
+        "email": email,
+        "phone": phone,
+        "state": state_val,
+        "city": cities[rng.integers(0, len(cities), n)],
+        "signup_date": _random_dates(today - pd.DateOffset(years=5), today, n, rng),
+        "plan_tier": rng.choice(PLAN_TIERS, n),
+    })
+
+
+def generate_sales_transactions(
+    n: int = 30_000, rng: np.random.Generator | None = None
+) -> pa.Table:
     """Generate sales with ~1% negative totals, ~2% future dates, ~2% dup transaction_ids."""
-    txn_pool = [fake.uuid4() for _ in range(int(n * 0.98))]
+    rng = rng if rng is not None else make_rng()
+    txn_pool = _uuid4_array(int(n * 0.98), rng)
     today = pd.Timestamp.today()
     future_cutoff = today + pd.Timedelta(days=180)
 
-    records = []
-    for i in range(n):
-        product = random.choice(PRODUCTS)
-        qty = random.randint(1, 10)
-        unit_price = product[3] * random.uniform(0.85, 1.15)
-        total = round(qty * unit_price, 4)
-
-        # ~1% refunds (negative totals)
-        if random.random() < 0.01:
-            total = -abs(total)
-
-        # ~2% future dates
-        if random.random() < 0.02:
-            txn_date = fake.date_between(
-                start_date=today.date(), end_date=future_cutoff.date()
-            ).isoformat()
-        else:
-            txn_date = fake.date_between(start_date="-3y", end_date="today").isoformat()
-
-        # ~2% duplicate transaction IDs
-        if random.random() < 0.02 and txn_pool:
-            txn_id = random.choice(txn_pool[:100])
-        else:
-            txn_id = txn_pool[i % len(txn_pool)]
-
-        records.append({
-            "transaction_id": txn_id,
-            "user_id": fake.uuid4(),
-            "product_id": product[0],
-            "product_name": product[1],
-            "category": product[2],
-            "quantity": qty,
-            "unit_price": round(unit_price, 4),
-            "total_amount": total,
-            "region": random.choice(REGIONS),
-            "transaction_date": txn_date,
-        })
-    return pd.DataFrame(records)
+    product_ids, product_names, categories, base_prices = map(np.array, zip(*PRODUCTS))
+    product_idx = rng.integers(0, len(PRODUCTS), n)
+    qty = rng.integers(1, 11, n, dtype=np.int32)
+    unit_price = base_prices[product_idx] * rng.uniform(0.85, 1.15, n)
+    total = np.round(qty * unit_price, 4)
+
+    # ~1% refunds (negative totals)
+    total = np.where(rng.random(n) < 0.01, -np.abs(total), total)
+
+    # ~2% future dates
+    txn_date = np.where(
+        rng.random(n) < 0.02,
+        _random_dates(today, future_cutoff, n, rng),
+        _random_dates(today - pd.DateOffset(years=3), today, n, rng),
+    )
+
+    # ~2% duplicate transaction IDs
+    txn_id = np.where(
+        rng.random(n) < 0.02,
+        txn_pool[rng.integers(0, min(100, len(txn_pool)), n)],
+        txn_pool[np.arange(n) % len(txn_pool)],
+    )
+
+    # Arrow columns map 1:1 onto Parquet — no pandas block manager in between
+    return pa.Table.from_pydict({
+        "transaction_id": pa.array(txn_id, type=pa.string()),
+        "user_id": pa.array(_uuid4_array(n, rng), type=pa.string()),
+        "product_id": pa.array(product_ids[product_idx], type=pa.string()),
+        "product_name": pa.array(product_names[product_idx], type=pa.string()),
+        "category": pa.array(categories[product_idx], type=pa.string()),
+        "quantity": pa.array(qty, type=pa.int32()),
+        "unit_price": pa.array(np.round(unit_price, 4), type=pa.float64()),
+        "total_amount": pa.array(total, type=pa.float64()),
+        "region": pa.array(rng.choice(REGIONS, n), type=pa.string()),
+        "transaction_date": pa.array(txn_date, type=pa.string()),
+    })
 
 
 # ---------------------------------------------------------------------------
 # Entry point — write files to RAW_DATA_DIR
 # ---------------------------------------------------------------------------
 
+def _write_web_events(output_dir: Path, n: int, seed: np.random.SeedSequence) -> int:
+    """Worker: generate web events and write web_events.json; return row count."""
+    events = generate_web_events(n, make_rng(seed))
+    with open(output_dir / "web_events.json", "wb") as fh:
+        fh.write(orjson.dumps(events))
+    return len(events)
+
+
+def _write_web_events_parquet(
+    output_dir: Path, n: int, seed: np.random.SeedSequence
+) -> int:
+    """Worker: generate web events and write web_events.parquet; return row count."""
+    columns = _web_event_columns(n, make_rng(seed))
+    # Mixed ISO / epoch values become one string column — the same text the
+    # bronze loader would store — so the dirty-timestamp split is preserved.
+    columns["timestamp"] = columns["timestamp"].astype(str)
+    table = pa.Table.from_pydict(
+        {name: pa.array(col, type=pa.string()) for name, col in columns.items()}
+    )
+    pq.write_table(table, output_dir / "web_events.parquet", compression="zstd")
+    return table.num_rows
+
+
+def _write_crm_users(output_dir: Path, n: int, seed: np.random.SeedSequence) -> int:
+    """Worker: generate CRM users and write crm_users.csv; return row count."""
+    users_df = generate_crm_users(n, make_rng(seed))
+    users_df.to_csv(output_dir / "crm_users.csv", index=False)
+    return len(users_df)
+
+
+def _write_sales_transactions(
+    output_dir: Path, n: int, seed: np.random.SeedSequence
+) -> int:
+    """Worker: generate sales and write sales_transactions.parquet; return row count."""
+    sales = generate_sales_transactions(n, make_rng(seed))
+    pq.write_table(sales, output_dir / "sales_transactions.parquet", compression="snappy")
+    return sales.num_rows
+
+
 def generate_all(output_dir: Path) -> None:
-    """Generate all three datasets and write to *output_dir*."""
+    """
+    Generate all three datasets and write to *output_dir*.
+    Set WEB_EVENTS_FORMAT=parquet to write web_events.parquet instead of JSON.
+
+    Each dataset is generated and written in its own worker process; workers
+    get independent child seeds spawned from SeedSequence(42), so output is
+    reproducible regardless of scheduling.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    print("  Generating web_events.json (40k rows)…")
-    events = generate_web_events(40_000)
-    with open(output_dir / "web_events.json", "w", encoding="utf-8") as fh:
-        json.dump(events, fh, default=str)
-    print(f"    → {len(events):,} rows written")
-
-    print("  Generating crm_users.csv (30k rows)…")
-    users_df = generate_crm_users(30_000)
-    users_df.to_csv(output_dir / "crm_users.csv", index=False)
-    print(f"    → {len(users_df):,} rows written")
+    # web_events defaults to JSON for legacy consumers; opt in to Parquet
+    web_events_format = os.environ.get("WEB_EVENTS_FORMAT", "json")
+    web_events_writers = {"json": _write_web_events, "parquet": _write_web_events_parquet}
+    if web_events_format not in web_events_writers:
+        raise ValueError(
+            f"WEB_EVENTS_FORMAT must be one of {sorted(web_events_writers)}, "
+            f"got {web_events_format!r}"
+        )
 
-    print("  Generating sales_transactions.parquet (30k rows)…")
-    sales_df = generate_sales_transactions(30_000)
-    sales_df.to_parquet(output_dir / "sales_transactions.parquet", index=False)
-    print(f"    → {len(sales_df):,} rows written")
+    jobs = [
+        (
+            f"web_events.{web_events_format}",
+            web_events_writers[web_events_format],
+            40_000,
+        ),
+        ("crm_users.csv", _write_crm_users, 30_000),
+        ("sales_transactions.parquet", _write_sales_transactions, 30_000),
+    ]
+    seeds = np.random.SeedSequence(42).spawn(len(jobs))
+
+    print(f"  Generating {', '.join(name for name, _, _ in jobs)} in parallel…")
+    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {
+            name: pool.submit(writer, output_dir, n, seed)
+            for (name, writer, n), seed in zip(jobs, seeds)
+        }
+        for name, future in futures.items():
+            print(f"    → {name}: {future.result():,} rows written")
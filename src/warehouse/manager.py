@@ -5,23 +5,62 @@ Credits model: 1 credit = 60 wall-clock seconds of query execution time.
 """
 from __future__ import annotations
 
+import functools
+import os
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import sqlparse
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
-from tabulate import tabulate
+from sqlalchemy.engine import Engine, RowMapping
+from sqlalchemy.sql.elements import TextClause
 
 CREDITS_PER_SECOND: float = 1.0 / 60.0   # 1 credit = 60 s
 
+# DBAPI drivers that accept several ';'-separated statements in one execute()
+_MULTI_STATEMENT_DRIVERS = frozenset({"psycopg2", "psycopg"})
+
+
+def _split_statements(sql_text: str) -> list[str]:
+    """
+    Split a multi-statement SQL script with sqlparse's tokenizer, so ';'
+    inside string literals or dollar-quoted bodies is left alone.
+    Comment-only fragments are dropped.
+    """
+    return [
+        stmt
+        for stmt in sqlparse.split(sql_text)
+        if sqlparse.format(stmt, strip_comments=True).strip()
+    ]
+
+
+# Both caches key on (path, mtime_ns): an edited file gets a fresh entry, while
+# repeated setup_schemas() runs (e.g. per test) skip the disk read and re-parse.
+@functools.lru_cache(maxsize=64)
+def _read_sql(path_str: str, mtime_ns: int) -> str:
+    """Return the text of the SQL file at *path_str*."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled_statements(path_str: str, mtime_ns: int) -> tuple[TextClause, ...]:
+    """Return the statements of the SQL file at *path_str* as text() clauses."""
+    return tuple(
+        text(stmt) for stmt in _split_statements(_read_sql(path_str, mtime_ns))
+    )
+
 
 class WarehouseManager:
     """Manages DDL lifecycle and tracks query performance credits."""
 
     def __init__(self, engine: Engine) -> None:
         self.engine = engine
+        # Elapsed time is kept as integer nanoseconds; seconds/credits are
+        # derived only when a report is built.
         self._credit_log: list[dict[str, Any]] = []
+        self._total_elapsed_ns: int = 0   # running total, avoids re-summing the log
 
     # ------------------------------------------------------------------
     # Schema management
@@ -30,7 +69,8 @@ class WarehouseManager:
     def setup_schemas(self, schema_dir: Path | None = None) -> None:
         """
         Execute every .sql file in *schema_dir* in alphabetical order.
-        Splits each file on ';' so multi-statement files work correctly.
+        On drivers that accept multi-statement strings each file is sent in a
+        single round-trip; otherwise it is split into statements with sqlparse.
         """
         if schema_dir is None:
             from src.config import SCHEMA_DIR
@@ -40,13 +80,19 @@ class WarehouseManager:
         if not sql_files:
             raise FileNotFoundError(f"No .sql files found in {schema_dir}")
 
+        batch = self.engine.dialect.driver in _MULTI_STATEMENT_DRIVERS
+
         with self.engine.begin() as conn:
             for sql_file in sql_files:
-                statements = sql_file.read_text(encoding="utf-8").split(";")
-                for stmt in statements:
-                    stmt = stmt.strip()
-                    if stmt:
-                        conn.execute(text(stmt))
+                key = (str(sql_file), sql_file.stat().st_mtime_ns)
+                if batch:
+                    # no_parameters: pass the script through untouched (no %-format)
+                    conn.exec_driver_sql(
+                        _read_sql(*key), execution_options={"no_parameters": True}
+                    )
+                    continue
+                for stmt in _compiled_statements(*key):
+                    conn.execute(stmt)
 
         print(f"  Schemas created from: {[f.name for f in sql_files]}")
 
@@ -79,65 +125,113 @@ class WarehouseManager:
         list[dict]
             Result rows as dicts (empty list for DML/DDL).
         """
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         rows: list[dict[str, Any]] = []
 
         with self.engine.connect() as conn:
             result = conn.execute(text(sql), params or {})
             if result.returns_rows:
-                rows = [dict(r._mapping) for r in result]
-
-        elapsed = time.perf_counter() - t0
-        credits = elapsed * CREDITS_PER_SECOND
-
-        self._credit_log.append(
-            {
-                "label": label,
-                "elapsed_s": round(elapsed, 6),
-                "credits": round(credits, 8),
-            }
-        )
+                rows = [dict(r) for r in result.mappings()]
+
+        self._log_query(label, time.perf_counter_ns() - t0)
         return rows
 
+    def execute_tracked_query_iter(
+        self,
+        sql: str,
+        label: str,
+        params: dict[str, Any] | None = None,
+        yield_per: int = 1_000,
+    ) -> Iterator[RowMapping]:
+        """
+        Streaming variant of :meth:`execute_tracked_query`, for row-returning
+        queries (SELECT / VALUES) only: on psycopg2 the statement runs inside a
+        server-side cursor, which Postgres rejects for DDL/DML.
+
+        Rows are fetched *yield_per* at a time and yielded as read-only
+        ``RowMapping`` views.  Only time spent executing and fetching is
+        billed; time the caller spends between rows is excluded.
+
+        Being a generator, nothing runs until the first ``next()``.  From then
+        on a pooled connection stays checked out until the generator is
+        exhausted or ``close()``-d (e.g. via ``contextlib.closing``); the credit
+        entry is logged at that point.  A generator that is never iterated
+        logs nothing.
+        """
+        elapsed_ns = 0
+        t0: int | None = time.perf_counter_ns()   # None while the caller holds a batch
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execution_options(
+                    stream_results=True, yield_per=yield_per
+                ).execute(text(sql), params or {})
+                if not result.returns_rows:
+                    return
+                for batch in result.mappings().partitions():
+                    elapsed_ns += time.perf_counter_ns() - t0
+                    t0 = None
+                    yield from batch
+                    t0 = time.perf_counter_ns()
+        finally:
+            if t0 is not None:
+                elapsed_ns += time.perf_counter_ns() - t0
+            self._log_query(label, elapsed_ns)
+
+    def _log_query(self, label: str, elapsed_ns: int) -> None:
+        """Append one credit-log entry and bump the running total."""
+        self._total_elapsed_ns += elapsed_ns
+        self._credit_log.append({"label": label, "elapsed_ns": elapsed_ns})
+
     # ------------------------------------------------------------------
     # Credit reporting
     # ------------------------------------------------------------------
 
     def get_credit_report(self) -> dict[str, Any]:
         """Return summary stats over all tracked queries."""
-        if not self._credit_log:
-            return {"entries": [], "total_credits": 0.0, "total_elapsed_s": 0.0}
-
-        total_elapsed = sum(e["elapsed_s"] for e in self._credit_log)
-        total_credits = sum(e["credits"] for e in self._credit_log)
         return {
-            "entries": list(self._credit_log),
-            "total_elapsed_s": round(total_elapsed, 6),
-            "total_credits": round(total_credits, 8),
+            "entries": [
+                {
+                    "label": e["label"],
+                    "elapsed_s": round(e["elapsed_ns"] / 1e9, 6),
+                    "credits": round(e["elapsed_ns"] * CREDITS_PER_SECOND / 1e9, 8),
+                }
+                for e in self._credit_log
+            ],
+            "total_elapsed_s": round(self._total_elapsed_ns / 1e9, 6),
+            "total_credits": round(self._total_elapsed_ns * CREDITS_PER_SECOND / 1e9, 8),
         }
 
     def print_credit_report(self) -> None:
-        """Pretty-print the credit log using tabulate (grid style)."""
+        """
+        Print the credit log as a fixed-width table.
+        Set FANCY_TABLES=1 to render with tabulate (grid style) instead.
+        """
         report = self.get_credit_report()
         if not report["entries"]:
             print("  No queries tracked yet.")
             return
 
+        headers = ["Query Label", "Time (s)", "Credits"]
         rows = [
             [e["label"], f"{e['elapsed_s']:.4f}", f"{e['credits']:.6f}"]
             for e in report["entries"]
         ]
         # Totals row
-        rows.append([
+        totals = [
             "─── TOTAL ───",
             f"{report['total_elapsed_s']:.4f}",
             f"{report['total_credits']:.6f}",
-        ])
+        ]
 
-        print(
-            tabulate(
-                rows,
-                headers=["Query Label", "Time (s)", "Credits"],
-                tablefmt="grid",
-            )
-        )
+        if os.environ.get("FANCY_TABLES"):
+            from tabulate import tabulate
+
+            print(tabulate([*rows, totals], headers=headers, tablefmt="grid"))
+            return
+
+        lw = max(len(r[0]) for r in [headers, *rows, totals])
+        rule = "-" * (lw + 2 + 10 + 2 + 12)
+        lines = [f"{headers[0]:<{lw}}  {headers[1]:>10}  {headers[2]:>12}", rule]
+        lines += [f"{label:<{lw}}  {t:>10}  {c:>12}" for label, t, c in rows]
+        lines += [rule, f"{totals[0]:<{lw}}  {totals[1]:>10}  {totals[2]:>12}"]
+        print("\n".join(lines))